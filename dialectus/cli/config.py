@@ -1,21 +1,53 @@
 """Configuration wrapper for CLI - uses engine's config models with env var fallback."""
 
+from __future__ import annotations
+
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dialectus.engine.config.settings import (
+        AppConfig,
+        ModelConfig,
+        DebateConfig,
+        JudgingConfig,
+        SystemConfig,
+        OllamaConfig,
+        OpenRouterConfig,
+        OpenAIConfig,
+        AnthropicConfig,
+    )
+
+# Re-export all config models for backward compatibility
+__all__ = [
+    "AppConfig",
+    "ModelConfig",
+    "DebateConfig",
+    "JudgingConfig",
+    "SystemConfig",
+    "OllamaConfig",
+    "OpenRouterConfig",
+    "OpenAIConfig",
+    "AnthropicConfig",
+    "ConfigurationError",
+    "get_default_config",
+]
+
+# Names defined in this module; everything else in __all__ is a config model
+# re-exported from the engine. Importing the settings module pulls in the
+# whole engine package, so those are resolved lazily by __getattr__.
+_CLI_NAMES = frozenset({"ConfigurationError", "get_default_config"})
+_ENGINE_CONFIG_MODELS = frozenset(__all__) - _CLI_NAMES
+
 
-# Import config models directly from the engine
-from dialectus.engine.config.settings import (
-    AppConfig,
-    ModelConfig,
-    DebateConfig,
-    JudgingConfig,
-    SystemConfig,
-    OllamaConfig,
-    OpenRouterConfig,
-    OpenAIConfig,
-    AnthropicConfig,
-)
+def __getattr__(name: str) -> Any:
+    if name in _ENGINE_CONFIG_MODELS:
+        from dialectus.engine.config import settings
+
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ConfigurationError(Exception):
@@ -41,21 +73,20 @@ def get_default_config() -> AppConfig:
             "Copy debate_config.example.json to get started."
         )
 
+    from dialectus.engine.config.settings import AppConfig
+
     # Load base config from file
     config = AppConfig.load_from_file(config_path)
 
     # Apply environment variable overrides
     # Priority: env var > config file > fail
-    openrouter_key_from_env = os.environ.get("OPENROUTER_API_KEY")
-    if openrouter_key_from_env:
+    if openrouter_key_from_env := os.environ.get("OPENROUTER_API_KEY"):
         config.system.openrouter.api_key = openrouter_key_from_env
 
-    anthropic_key_from_env = os.environ.get("ANTHROPIC_API_KEY")
-    if anthropic_key_from_env:
+    if anthropic_key_from_env := os.environ.get("ANTHROPIC_API_KEY"):
         config.system.anthropic.api_key = anthropic_key_from_env
 
-    openai_key_from_env = os.environ.get("OPENAI_API_KEY")
-    if openai_key_from_env:
+    if openai_key_from_env := os.environ.get("OPENAI_API_KEY"):
         config.system.openai.api_key = openai_key_from_env
 
     # Validate API keys for configured providers
@@ -109,19 +140,3 @@ def _print_api_key_error(provider_name: str, env_var_name: str) -> None:
         f"  2. Add to debate_config.json under system.{provider_name.lower()}.api_key\n",
         file=sys.stderr,
     )
-
-
-# Re-export all config models for backward compatibility
-__all__ = [
-    "AppConfig",
-    "ModelConfig",
-    "DebateConfig",
-    "JudgingConfig",
-    "SystemConfig",
-    "OllamaConfig",
-    "OpenRouterConfig",
-    "OpenAIConfig",
-    "AnthropicConfig",
-    "ConfigurationError",
-    "get_default_config",
-]
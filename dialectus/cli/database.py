@@ -1,12 +1,17 @@
 """Simplified SQLite database for CLI transcript storage (no users/auth/tournaments)."""
 
 import sqlite3
-import json
 import logging
+import threading
+from collections import defaultdict
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generator
 
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
 from dialectus.cli.db_types import (
     CriterionScoreRow,
     DebateNotFoundError,
@@ -24,9 +29,118 @@ from dialectus.cli.db_types import (
 
 logger = logging.getLogger(__name__)
 
-
+# Validate whole result sets in one call instead of once per row
+_TRANSCRIPT_LIST_ROWS = TypeAdapter(list[TranscriptListRow])
+_MESSAGE_ROWS = TypeAdapter(list[MessageRow])
+_CRITERION_SCORE_ROWS = TypeAdapter(list[CriterionScoreRow])
+
+SCHEMA_SQL = """
+-- ============================================
+-- DEBATE TABLES
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS debates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    format TEXT NOT NULL,
+    participants TEXT NOT NULL,  -- JSON string
+    final_phase TEXT NOT NULL,
+    total_rounds INTEGER NOT NULL,
+    saved_at TEXT NOT NULL,
+    message_count INTEGER NOT NULL,
+    word_count INTEGER NOT NULL,
+    total_debate_time_ms INTEGER NOT NULL,
+    scores TEXT,  -- JSON string
+    context_metadata TEXT,  -- JSON string
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    debate_id INTEGER NOT NULL,
+    speaker_id TEXT NOT NULL,
+    position TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    round_number INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    word_count INTEGER NOT NULL,
+    metadata TEXT,  -- JSON string
+    cost REAL,
+    generation_id TEXT,
+    cost_queried_at DATETIME,
+    FOREIGN KEY (debate_id) REFERENCES debates (id) ON DELETE CASCADE
+);
+
+-- ============================================
+-- JUDGING TABLES
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS judge_decisions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    debate_id INTEGER NOT NULL,
+    judge_model TEXT NOT NULL,
+    judge_provider TEXT NOT NULL,
+    winner_id TEXT NOT NULL,
+    winner_margin REAL NOT NULL,
+    overall_feedback TEXT,
+    reasoning TEXT,
+    generation_time_ms INTEGER,
+    cost REAL,
+    generation_id TEXT,
+    cost_queried_at DATETIME,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (debate_id) REFERENCES debates(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS criterion_scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    judge_decision_id INTEGER NOT NULL,
+    criterion TEXT NOT NULL,
+    participant_id TEXT NOT NULL,
+    score REAL NOT NULL,
+    feedback TEXT,
+    FOREIGN KEY (judge_decision_id) REFERENCES judge_decisions (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS ensemble_summary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    debate_id INTEGER NOT NULL UNIQUE,
+    final_winner_id TEXT NOT NULL,
+    final_margin REAL NOT NULL,
+    ensemble_method TEXT NOT NULL DEFAULT 'majority',
+    num_judges INTEGER NOT NULL,
+    consensus_level REAL,
+    summary_reasoning TEXT,
+    summary_feedback TEXT,
+    participating_judge_decision_ids TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (debate_id) REFERENCES debates(id) ON DELETE CASCADE
+);
+
+-- ============================================
+-- INDEXES FOR PERFORMANCE
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_debates_created_at ON debates (created_at DESC);
+-- idx_messages_debate_round covers debate_id lookups as its leading column, and
+-- its implicit rowid suffix serves ORDER BY round_number, id
+DROP INDEX IF EXISTS idx_messages_debate_id;
+DROP INDEX IF EXISTS idx_messages_round_phase;
+CREATE INDEX IF NOT EXISTS idx_messages_debate_round ON messages (debate_id, round_number);
+CREATE INDEX IF NOT EXISTS idx_judge_decisions_debate_id ON judge_decisions (debate_id);
+CREATE INDEX IF NOT EXISTS idx_criterion_scores_decision_id ON criterion_scores (judge_decision_id);
+CREATE INDEX IF NOT EXISTS idx_ensemble_summary_debate_id ON ensemble_summary (debate_id);
+"""
+
+
+@lru_cache(maxsize=1)
 def get_database_path() -> Path:
-    """Get the database path (in user's home directory)."""
+    """Get the database path (in user's home directory).
+
+    The directory is created on the first call; later calls return the
+    cached path without touching the filesystem.
+    """
     db_dir = Path.home() / ".dialectus"
     db_dir.mkdir(parents=True, exist_ok=True)
     return db_dir / "debates.db"
@@ -37,50 +151,85 @@ class DatabaseManager:
 
     def __init__(self, db_path: str | None = None):
         self.db_path = db_path or str(get_database_path())
+        self._conn: sqlite3.Connection | None = None
+        self._conn_path: str | None = None
+        self._lock = threading.RLock()
         self._ensure_schema()
 
+    def _write_connection(self) -> sqlite3.Connection:
+        """Return the shared write connection, reopening it if db_path changed."""
+        if self._conn is None or self._conn_path != self.db_path:
+            self.close()
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL only needs a full fsync at checkpoints; NORMAL is still
+            # durable against application crashes.
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._conn = conn
+            self._conn_path = self.db_path
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared write connection if one is open."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._conn_path = None
+
     @contextmanager
     def get_connection(
         self, read_only: bool = False
     ) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections with automatic commit/rollback."""
-        if read_only:
-            db_uri = f"file:{Path(self.db_path).resolve().as_posix()}?mode=ro"
-            conn = sqlite3.connect(db_uri, uri=True)
-            conn.row_factory = sqlite3.Row
-        else:
-            conn = sqlite3.connect(self.db_path)
+        """Context manager for database connections with automatic commit/rollback.
 
+        Writes share one long-lived connection guarded by a lock; read-only
+        connections are opened per call so they always see the current file.
+        """
+        if not read_only:
+            with self._lock:
+                conn = self._write_connection()
+                # Take the write lock up front so each save is a single
+                # transaction; nested calls join the outer one.
+                owns_transaction = not conn.in_transaction
+                if owns_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                    if owns_transaction:
+                        conn.commit()
+                except BaseException:
+                    # The connection outlives this call, so a KeyboardInterrupt
+                    # or cancellation must not leave a transaction open for the
+                    # next caller to join
+                    if owns_transaction:
+                        conn.rollback()
+                    raise
+            return
+
+        db_uri = f"file:{Path(self.db_path).resolve().as_posix()}?mode=ro"
+        conn = sqlite3.connect(db_uri, uri=True)
+        conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         try:
             yield conn
-            if not read_only:
-                conn.commit()
-        except Exception:
-            if not read_only:
-                conn.rollback()
-            raise
         finally:
             conn.close()
 
     def _ensure_schema(self) -> None:
         """Create database schema if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        try:
-            # Read and execute schema from schema.sql
-            schema_path = Path(__file__).parent / "schema.sql"
-            if schema_path.exists():
-                with open(schema_path, encoding="utf-8") as f:
-                    schema_sql = f.read()
-                conn.executescript(schema_sql)
-            else:
-                raise RuntimeError(f"Database schema file not found: {schema_path}")
-
+        with self._lock:
+            conn = self._write_connection()
+            # WAL is persistent in the database file, so readers no longer
+            # block behind a save and commits avoid rewriting a rollback journal.
+            # journal_mode can't change inside a transaction, so this and the
+            # schema script run outside get_connection().
+            conn.execute("PRAGMA journal_mode = WAL")
+
+            conn.executescript(SCHEMA_SQL)
+            conn.execute("PRAGMA optimize")
             conn.commit()
-            logger.info(f"Database schema initialized at {self.db_path}")
-        finally:
-            conn.close()
+            logger.info("Database schema initialized at %s", self.db_path)
 
     def save_debate(self, transcript_data: DebateTranscriptData) -> int:
         """Save debate transcript and messages. Returns debate ID."""
@@ -103,16 +252,14 @@ class DatabaseManager:
                 (
                     metadata.topic,
                     metadata.format,
-                    json.dumps({
-                        k: v.model_dump() for k, v in metadata.participants.items()
-                    }),
+                    to_json(metadata.participants).decode(),
                     metadata.final_phase,
                     metadata.total_rounds,
                     metadata.saved_at,
                     metadata.message_count,
                     metadata.word_count,
                     metadata.total_debate_time_ms,
-                    json.dumps(metadata.model_dump()),
+                    metadata.model_dump_json(),
                 ),
             )
 
@@ -124,16 +271,16 @@ class DatabaseManager:
                 )
 
             # Insert messages
-            for message in transcript_data.messages:
-                cursor.execute(
-                    """
-                    INSERT INTO messages (
-                        debate_id, speaker_id, position, phase, round_number,
-                        content, timestamp, word_count, metadata, cost,
-                        generation_id, cost_queried_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            cursor.executemany(
+                """
+                INSERT INTO messages (
+                    debate_id, speaker_id, position, phase, round_number,
+                    content, timestamp, word_count, metadata, cost,
+                    generation_id, cost_queried_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         debate_id,
                         message.speaker_id,
@@ -143,14 +290,19 @@ class DatabaseManager:
                         message.content,
                         message.timestamp,
                         message.word_count,
-                        json.dumps(message.metadata or {}),
+                        # Store NULL rather than "{}" when there is nothing to keep
+                        to_json(message.metadata).decode()
+                        if message.metadata
+                        else None,
                         message.cost,
                         message.generation_id,
                         message.cost_queried_at,
-                    ),
-                )
+                    )
+                    for message in transcript_data.messages
+                ],
+            )
 
-            logger.info(f"Saved debate transcript with ID {debate_id}")
+            logger.info("Saved debate transcript with ID %d", debate_id)
             return debate_id
 
     def save_judge_decision(
@@ -201,7 +353,7 @@ class DatabaseManager:
                 raise RuntimeError(
                     "Failed to determine judge decision ID after insert."
                 )
-            logger.info(f"Saved judge decision with ID {decision_id}")
+            logger.info("Saved judge decision with ID %d", decision_id)
             return decision_id
 
     def save_criterion_scores(
@@ -211,24 +363,26 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            for score in criterion_data:
-                cursor.execute(
-                    """
-                    INSERT INTO criterion_scores (
-                        judge_decision_id, criterion, participant_id, score, feedback
-                    )
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
+            cursor.executemany(
+                """
+                INSERT INTO criterion_scores (
+                    judge_decision_id, criterion, participant_id, score, feedback
+                )
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         decision_id,
                         score["criterion"],
                         score["participant_id"],
                         score["score"],
                         score.get("feedback"),
-                    ),
-                )
+                    )
+                    for score in criterion_data
+                ],
+            )
 
-            logger.info(f"Saved {len(criterion_data)} criterion scores")
+            logger.info("Saved %d criterion scores", len(criterion_data))
 
     def save_ensemble_summary(
         self, debate_id: int, ensemble_data: EnsembleSummaryData
@@ -265,7 +419,7 @@ class DatabaseManager:
                 raise RuntimeError(
                     "Failed to determine ensemble summary ID after insert."
                 )
-            logger.info(f"Saved ensemble summary with ID {summary_id}")
+            logger.info("Saved ensemble summary with ID %d", summary_id)
             return summary_id
 
     def list_transcripts(
@@ -285,8 +439,7 @@ class DatabaseManager:
                 (limit, offset),
             )
 
-            rows = cursor.fetchall()
-            return [TranscriptListRow.model_validate(dict(row)) for row in rows]
+            return _TRANSCRIPT_LIST_ROWS.validate_python([dict(row) for row in cursor])
 
     def load_transcript(self, debate_id: int) -> TranscriptData:
         """Load full debate transcript including messages.
@@ -315,9 +468,7 @@ class DatabaseManager:
                 """,
                 (debate_id,),
             )
-            messages = [
-                MessageRow.model_validate(dict(row)) for row in cursor.fetchall()
-            ]
+            messages = _MESSAGE_ROWS.validate_python([dict(row) for row in cursor])
 
             return TranscriptData(metadata=debate, messages=messages)
 
@@ -350,9 +501,9 @@ class DatabaseManager:
                 """,
                 (decision_dict["id"],),
             )
-            criterion_scores = [
-                CriterionScoreRow.model_validate(dict(row)) for row in cursor.fetchall()
-            ]
+            criterion_scores = _CRITERION_SCORE_ROWS.validate_python([
+                dict(row) for row in cursor
+            ])
 
             # Build the complete result
             return JudgeDecisionWithScores.model_validate({
@@ -375,31 +526,35 @@ class DatabaseManager:
             cursor.execute(
                 "SELECT * FROM judge_decisions WHERE debate_id = ?", (debate_id,)
             )
-            decision_rows = [dict(row) for row in cursor.fetchall()]
-
-            # Get criterion scores for each decision
-            results: list[JudgeDecisionWithScores] = []
-            for decision_dict in decision_rows:
-                cursor.execute(
-                    """
-                    SELECT * FROM criterion_scores
-                    WHERE judge_decision_id = ?
-                    """,
-                    (decision_dict["id"],),
-                )
-                criterion_scores = [
-                    CriterionScoreRow.model_validate(dict(row))
-                    for row in cursor.fetchall()
-                ]
+            decision_rows = [dict(row) for row in cursor]
+
+            if not decision_rows:
+                return []
 
-                result = JudgeDecisionWithScores.model_validate({
+            # Get criterion scores for all decisions in one query
+            placeholders = ", ".join("?" * len(decision_rows))
+            cursor.execute(
+                f"""
+                SELECT * FROM criterion_scores
+                WHERE judge_decision_id IN ({placeholders})
+                ORDER BY id
+                """,
+                [decision_dict["id"] for decision_dict in decision_rows],
+            )
+            scores_by_decision: dict[int, list[CriterionScoreRow]] = defaultdict(list)
+            for score in _CRITERION_SCORE_ROWS.validate_python([
+                dict(row) for row in cursor
+            ]):
+                scores_by_decision[score.judge_decision_id].append(score)
+
+            return [
+                JudgeDecisionWithScores.model_validate({
                     **decision_dict,
-                    "criterion_scores": criterion_scores,
+                    "criterion_scores": scores_by_decision[decision_dict["id"]],
                     "metadata": {"judge_model": decision_dict["judge_model"]},
                 })
-                results.append(result)
-
-            return results
+                for decision_dict in decision_rows
+            ]
 
     def load_ensemble_summary(self, debate_id: int) -> EnsembleSummaryRow:
         """Load ensemble summary.
@@ -1,6 +1,6 @@
 """Type-safe models for database row returns.
 
-These Pydantic models match the exact schema from schema.sql, ensuring
+These Pydantic models match the exact schema in database.SCHEMA_SQL, ensuring
 type-safe access to database query results throughout the CLI.
 """
 
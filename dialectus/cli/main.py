@@ -1,10 +1,14 @@
 """Command-line interface for the Dialectus Debate System."""
 
+from __future__ import annotations
+
 import asyncio
+import io
 import logging
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 # Allow running this module either as ``python -m dialectus.cli`` or
 # ``python dialectus/cli/main.py`` by ensuring the project root is on sys.path.
@@ -21,52 +25,81 @@ os.environ["PYTHONIOENCODING"] = "utf-8"
 # This fixes Git Bash/Windows console cp1252 encoding issues with box-drawing chars
 # Skip this when running under pytest to avoid conflicts with pytest's capture mechanism
 if sys.platform == "win32" and "pytest" not in sys.modules:
-    import io
-
-    # Wrap stdout with UTF-8 encoding, ignoring errors for incompatible chars
-    sys.stdout = io.TextIOWrapper(
-        sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True
-    )
-    sys.stderr = io.TextIOWrapper(
-        sys.stderr.buffer, encoding="utf-8", errors="replace", line_buffering=True
-    )
+    # Switch the existing streams to UTF-8 in place, replacing incompatible chars
+    for stream in (sys.stdout, sys.stderr):
+        if isinstance(stream, io.TextIOWrapper):
+            stream.reconfigure(encoding="utf-8", errors="replace", line_buffering=True)
 
 import click
 from rich.console import Console
 from rich.prompt import Confirm
 from rich.table import Table
 
-from dialectus.cli.config import AppConfig, ConfigurationError, get_default_config
-from dialectus.cli.runner import DebateRunner
+from dialectus.cli.config import ConfigurationError, get_default_config
 from dialectus.cli.database import DatabaseManager
-from dialectus.cli.presentation import display_debate_info, display_error
+from dialectus.cli.presentation import (
+    display_debate_info,
+    display_error,
+    truncate_text,
+)
+
+# The runner and engine config models pull in dialectus-engine and every
+# provider SDK, so they are imported by the commands that use them. This
+# keeps --help and transcripts from paying that startup cost.
+if TYPE_CHECKING:
+    from dialectus.cli.config import AppConfig
 
 
 console = Console(force_terminal=True, legacy_windows=False)
 
 
-def setup_logging(level: str = "WARNING") -> None:
-    """Configure logging for the application with colored output."""
-
-    # Custom formatter with colors for severity levels
-    class ColoredFormatter(logging.Formatter):
-        """Formatter that adds colors to log levels."""
-
-        COLORS = {
-            "DEBUG": "\033[90m",  # Gray/dim
-            "INFO": "",  # Default (no color)
-            "WARNING": "\033[33m",  # Yellow/orange
-            "ERROR": "\033[31m",  # Red
-            "CRITICAL": "\033[1;31m",  # Bold red
+class ColoredFormatter(logging.Formatter):
+    """Formatter that adds colors to log levels."""
+
+    COLORS = {
+        "DEBUG": "\033[90m",  # Gray/dim
+        "INFO": "",  # Default (no color)
+        "WARNING": "\033[33m",  # Yellow/orange
+        "ERROR": "\033[31m",  # Red
+        "CRITICAL": "\033[1;31m",  # Bold red
+    }
+    RESET = "\033[0m"
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        # Colored level names are built once rather than per record
+        self._colored_levelnames = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
         }
-        RESET = "\033[0m"
 
-        def format(self, record: logging.LogRecord) -> str:
-            color = self.COLORS.get(record.levelname, "")
-            record.levelname = f"{color}{record.levelname}{self.RESET}"
-            return super().format(record)
+    def format(self, record: logging.LogRecord) -> str:
+        levelname = record.levelname
+        record.levelname = self._colored_levelnames.get(
+            levelname, f"{levelname}{self.RESET}"
+        )
+        return super().format(record)
+
+
+# Loggers for chatty third-party libraries, capped at WARNING
+_NOISY_LOGGERS = ("openai", "httpx", "openai._base_client", "urllib3")
+
+
+def setup_logging(level: str = "WARNING") -> None:
+    """Configure logging for the application with colored output.
+
+    Safe to call more than once: the handler is installed only if the root
+    logger has none, and later calls just change the level.
+    """
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper()))
+
+    # Suppress noisy third-party loggers
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    if root.handlers:
+        return
 
-    # Configure basic logging
     handler = logging.StreamHandler()
     handler.setFormatter(
         ColoredFormatter(
@@ -74,17 +107,7 @@ def setup_logging(level: str = "WARNING") -> None:
             datefmt="%H:%M:%S",
         )
     )
-
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        handlers=[handler],
-    )
-
-    # Suppress noisy third-party loggers
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("openai._base_client").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    root.addHandler(handler)
 
 
 @click.group()
@@ -103,11 +126,29 @@ def setup_logging(level: str = "WARNING") -> None:
 @click.pass_context
 def cli(ctx: click.Context, config: str | None, log_level: str | None) -> None:
     """Dialectus - AI-powered debate orchestration using dialectus-engine."""
-    # Load configuration first
+    # Configuration is loaded on first use by the subcommands that need it,
+    # so --help and transcripts don't pay for parsing and validating it.
+    setup_logging(log_level or "WARNING")
+
+    ctx.ensure_object(dict)
+    ctx.obj["config_path"] = config
+    ctx.obj["log_level"] = log_level
+
+
+def _load_config(ctx: click.Context) -> AppConfig:
+    """Load the application config once per invocation and memoize it."""
+    obj = cast("dict[str, Any]", ctx.find_root().ensure_object(dict))
+    cached = obj.get("config")
+    if cached is not None:
+        return cast("AppConfig", cached)
+
+    config_path: str | None = obj.get("config_path")
     try:
-        if config:
-            app_config = AppConfig.load_from_file(Path(config))
-            console.print(f"[green]OK[/green] Loaded config from {config}")
+        if config_path:
+            from dialectus.cli.config import AppConfig
+
+            app_config = AppConfig.load_from_file(Path(config_path))
+            console.print(f"[green]OK[/green] Loaded config from {config_path}")
         else:
             app_config = get_default_config()
             console.print(
@@ -118,13 +159,11 @@ def cli(ctx: click.Context, config: str | None, log_level: str | None) -> None:
         raise SystemExit(1)
 
     # Use CLI log level if provided, otherwise use config file value
-    effective_log_level = (
-        log_level if log_level is not None else app_config.system.log_level
-    )
-    setup_logging(effective_log_level)
+    if obj.get("log_level") is None:
+        setup_logging(app_config.system.log_level)
 
-    ctx.ensure_object(dict)
-    ctx.obj["config"] = app_config
+    obj["config"] = app_config
+    return app_config
 
 
 @cli.command()
@@ -145,7 +184,7 @@ def debate(
     interactive: bool,
 ) -> None:
     """Start a debate between AI models using the engine directly."""
-    config: AppConfig = ctx.obj["config"]
+    config = _load_config(ctx)
 
     # Override config with CLI options
     if topic:
@@ -160,6 +199,8 @@ def debate(
         console.print("[yellow]Debate cancelled[/yellow]")
         return
 
+    from dialectus.cli.runner import DebateRunner
+
     # Run the debate with direct engine integration
     try:
         runner = DebateRunner(config, console)
@@ -173,7 +214,7 @@ def debate(
 @click.pass_context
 def list_models(ctx: click.Context) -> None:
     """List available models from configured providers."""
-    config: AppConfig = ctx.obj["config"]
+    config = _load_config(ctx)
 
     async def _list_models() -> None:
         # Import provider modules and types at the top of the function
@@ -217,14 +258,7 @@ def list_models(ctx: click.Context) -> None:
             "openai": OpenAIProvider,
         }
 
-        # Query each provider that's in use
-        for provider_name in sorted(providers_in_use):
-            if provider_name not in provider_classes:
-                console.print(
-                    f"[yellow]Warning: Unknown provider '{provider_name}'[/yellow]"
-                )
-                continue
-
+        async def _fetch_models(provider_name: str) -> list[BaseEnhancedModelInfo]:
             console.print(f"Fetching models from {provider_name}...")
 
             try:
@@ -239,17 +273,32 @@ def list_models(ctx: click.Context) -> None:
                     list[BaseEnhancedModelInfo],
                     await provider.get_enhanced_models(),  # type: ignore[misc]
                 )
-                all_models.extend(provider_models)
-
+            except Exception as e:
                 console.print(
-                    f"[green]OK[/green] Found {len(provider_models)} models from {provider_name}"
+                    f"[yellow]SKIP[/yellow] Could not fetch models from {provider_name}: {e}"
                 )
+                # Skip this provider instead of failing completely
+                return []
 
-            except Exception as e:
+            console.print(
+                f"[green]OK[/green] Found {len(provider_models)} models from {provider_name}"
+            )
+            return provider_models
+
+        known_providers: list[str] = []
+        for provider_name in sorted(providers_in_use):
+            if provider_name not in provider_classes:
                 console.print(
-                    f"[yellow]SKIP[/yellow] Could not fetch models from {provider_name}: {e}"
+                    f"[yellow]Warning: Unknown provider '{provider_name}'[/yellow]"
                 )
-                # Continue to next provider instead of failing completely
+                continue
+            known_providers.append(provider_name)
+
+        # Query every provider in use concurrently; each one is a network round-trip
+        for provider_models in await asyncio.gather(
+            *(_fetch_models(name) for name in known_providers)
+        ):
+            all_models.extend(provider_models)
 
         if not all_models:
             console.print(
@@ -275,11 +324,7 @@ def list_models(ctx: click.Context) -> None:
             table.add_row(
                 model.id,
                 model.provider,
-                (
-                    model.description[:60] + "..."
-                    if len(model.description) > 60
-                    else model.description
-                ),
+                truncate_text(model.description, 60),
             )
 
         console.print()
@@ -316,13 +361,9 @@ def transcripts(limit: int) -> None:
         table.add_column("Date", style="dim")
 
         for transcript in transcript_list:
-            topic = transcript.topic[:50]
-            if len(transcript.topic) > 50:
-                topic += "..."
-
             table.add_row(
                 str(transcript.id),
-                topic,
+                truncate_text(transcript.topic, 50),
                 transcript.format,
                 str(transcript.message_count),
                 transcript.created_at,
@@ -5,21 +5,27 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import Callable
-
-from rich.console import Console
+import traceback
+from bisect import bisect_right
+from collections import Counter
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Callable
+
+from rich.console import Console, Group, RenderableType
+from rich.constrain import Constrain
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
-from dialectus.cli.config import AppConfig
 from dialectus.cli.db_types import (
     CriterionScoreRow,
+    DisplayEnsembleMetadata,
     DisplayJudgeDecision,
     JudgeDecisionWithScores,
 )
-from dialectus.engine.models.providers import ProviderRateLimitError
 
-from textwrap import dedent
+if TYPE_CHECKING:
+    from dialectus.cli.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
@@ -28,26 +34,40 @@ MAX_REASONING_PREVIEW_LENGTH = (
     150  # Characters to show in individual judge reasoning preview
 )
 FEEDBACK_COLUMN_WIDTH = 50  # Width of feedback column in scoring tables
-FEEDBACK_TRUNCATE_LENGTH = 47  # Truncate feedback at this length (with "..." = 50)
+INDIVIDUAL_FEEDBACK_COLUMN_WIDTH = 35  # Feedback column width per ensemble judge
 LINE_WRAP_LENGTH = 100  # Maximum line length before wrapping in reasoning display
 
+# Victory margin thresholds; a margin at a bound falls into the stronger label
+_VICTORY_MARGIN_BOUNDS = (0.5, 1.0, 2.0, 3.0)
+_VICTORY_STRENGTH_LABELS = (
+    "Very Close",
+    "Close Victory",
+    "Clear Victory",
+    "Strong Victory",
+    "Decisive Victory",
+)
+
+# Patterns that mark reasoning as raw structured output rather than prose
+_STRUCTURED_DATA_PATTERNS = (
+    re.compile(r"^\s*\{.*:\s*.*\}\s*$", re.DOTALL),
+    re.compile(r"winner_id.*participant_id", re.DOTALL),
+)
+
 
 def display_debate_info(console: Console, config: AppConfig) -> None:
     """Render the core debate configuration details."""
     judge_info = _format_judge_info(config)
 
     info_panel = Panel.fit(
-        dedent(
-            f"""[bold]Topic:[/bold] {config.debate.topic}
-            [bold]Format:[/bold] {config.debate.format.title()}
-            [bold]Time per turn:[/bold] {config.debate.time_per_turn}s
-            [bold]Word limit:[/bold] {config.debate.word_limit}
-
-            [bold]Participants:[/bold]
-            {_format_participants(config)}
-
-            [bold]Judging:[/bold] {judge_info}"""
-        ),
+        f"[bold]Topic:[/bold] {config.debate.topic}\n"
+        f"[bold]Format:[/bold] {config.debate.format.title()}\n"
+        f"[bold]Time per turn:[/bold] {config.debate.time_per_turn}s\n"
+        f"[bold]Word limit:[/bold] {config.debate.word_limit}\n"
+        "\n"
+        "[bold]Participants:[/bold]\n"
+        f"{_format_participants(config)}\n"
+        "\n"
+        f"[bold]Judging:[/bold] {judge_info}",
         title="Debate Setup",
         border_style="blue",
     )
@@ -61,6 +81,9 @@ def display_judge_decision(
 ) -> None:
     """Render a judge decision, handling both single and ensemble cases.
 
+    The whole decision is collected into one renderable group and printed
+    once, so Rich renders and flushes it in a single pass.
+
     Args:
         console: Rich console for output
         config: App configuration with model details
@@ -68,6 +91,9 @@ def display_judge_decision(
     """
     # side_label_mapping = _build_side_label_mapping(decision)
 
+    # Participant IDs repeat across every criterion row and every individual
+    # judge, so resolve each one once per decision
+    @cache
     def get_display_name(participant_identifier: str) -> str:
         """Resolve display name for participant ID."""
         # TODO: Re-implement side label mapping if needed for display labels
@@ -79,43 +105,58 @@ def display_judge_decision(
     winner_display_name = get_display_name(winner_id)
     winner_margin = decision.winner_margin
 
-    console.print(f"\n[bold green]🏆 WINNER: {winner_display_name}[/bold green]")
+    parts: list[RenderableType] = [
+        Text.from_markup(f"\n[bold green]🏆 WINNER: {winner_display_name}[/bold green]")
+    ]
 
     if winner_margin > 0:
         victory_strength = _get_victory_strength(winner_margin)
-        console.print(
-            f"[dim]Victory Margin: {winner_margin:.1f} points"
-            f" ({victory_strength})[/dim]"
+        parts.append(
+            Text.from_markup(
+                f"[dim]Victory Margin: {winner_margin:.1f} points"
+                f" ({victory_strength})[/dim]"
+            )
         )
 
-    judge_info = _format_judge_decision_info(decision)
-    console.print(f"[dim]{judge_info}[/dim]")
+    metadata = decision.metadata
+    judge_info = _format_judge_decision_info(metadata)
+    parts.append(Text.from_markup(f"[dim]{judge_info}[/dim]"))
 
     if decision.overall_feedback:
-        console.print("\n[bold blue]Judge's Summary:[/bold blue]")
-        console.print(f"[italic]{decision.overall_feedback}[/italic]")
+        parts.extend((
+            Text.from_markup("\n[bold blue]Judge's Summary:[/bold blue]"),
+            Text.from_markup(f"[italic]{decision.overall_feedback}[/italic]"),
+        ))
 
-    _display_detailed_scoring(console, decision.criterion_scores, get_display_name)
-    _display_reasoning(console, decision.reasoning)
+    parts.extend(_render_detailed_scoring(decision.criterion_scores, get_display_name))
+    parts.extend(_render_reasoning(decision.reasoning))
 
-    metadata = decision.metadata
     individual_decisions = metadata.individual_decisions
     ensemble_size = metadata.ensemble_size
 
     if ensemble_size > 1 and individual_decisions:
-        console.print("\n[bold blue]Individual Judge Decisions:[/bold blue]")
+        parts.append(
+            Text.from_markup("\n[bold blue]Individual Judge Decisions:[/bold blue]")
+        )
         for index, individual_decision in enumerate(individual_decisions, start=1):
-            display_individual_judge_decision(
-                console, individual_decision, index, get_display_name
+            parts.extend(
+                _render_individual_judge_decision(
+                    individual_decision, index, get_display_name
+                )
             )
 
     if metadata.judge_model:
-        console.print(f"\n[dim]Judge Model: {metadata.judge_model}[/dim]")
+        parts.append(
+            Text.from_markup(f"\n[dim]Judge Model: {metadata.judge_model}[/dim]")
+        )
+
+    console.print(Group(*parts))
 
 
 def display_error(console: Console, error: Exception) -> None:
     """Render a Rich panel for exceptions, with provider-specific guidance."""
-    import traceback
+    # Deferred: importing the engine pulls in every provider SDK
+    from dialectus.engine.models.providers import ProviderRateLimitError
 
     if isinstance(error, ProviderRateLimitError):
         provider = error.provider.capitalize()
@@ -155,10 +196,10 @@ def display_error(console: Console, error: Exception) -> None:
         return
 
     error_panel = Panel.fit(
-        dedent(f"""[bold red]Exception Type:[/bold red] {type(error).__name__}
-            [bold red]Message:[/bold red] {str(error)}
-            [bold red]Call Stack:[/bold red]
-            {traceback.format_exc()}"""),
+        f"[bold red]Exception Type:[/bold red] {type(error).__name__}\n"
+        f"[bold red]Message:[/bold red] {error}\n"
+        "[bold red]Call Stack:[/bold red]\n"
+        f"{traceback.format_exc()}",
         title="[red]⚠️  Debate Failed[/red]",
         border_style="red",
         padding=(1, 2),
@@ -176,44 +217,67 @@ def display_individual_judge_decision(
     get_display_name_func: Callable[[str], str],
 ) -> None:
     """Render an individual judge decision for ensemble judging using Pydantic model."""
+    console.print(
+        Group(
+            *_render_individual_judge_decision(
+                decision, judge_number, get_display_name_func
+            )
+        )
+    )
+
+
+def _render_individual_judge_decision(
+    decision: JudgeDecisionWithScores,
+    judge_number: int,
+    get_display_name_func: Callable[[str], str],
+) -> list[RenderableType]:
+    """Build the renderables for one judge of an ensemble decision."""
     judge_model = decision.metadata.get("judge_model", f"Judge {judge_number}")
     winner_id = decision.winner_id
     winner_display_name = get_display_name_func(winner_id)
     winner_margin = decision.winner_margin
 
-    console.print(f"\n[bold cyan]🤖 Judge {judge_number} ({judge_model})[/bold cyan]")
-    console.print(f"[green]Winner: {winner_display_name}[/green]")
+    parts: list[RenderableType] = [
+        Text.from_markup(
+            f"\n[bold cyan]🤖 Judge {judge_number} ({judge_model})[/bold cyan]"
+        ),
+        Text.from_markup(f"[green]Winner: {winner_display_name}[/green]"),
+    ]
 
     if winner_margin > 0:
         victory_strength = _get_victory_strength(winner_margin)
-        console.print(
-            f"[dim]Margin: {winner_margin:.1f} points ({victory_strength})[/dim]"
+        parts.append(
+            Text.from_markup(
+                f"[dim]Margin: {winner_margin:.1f} points ({victory_strength})[/dim]"
+            )
         )
 
     if decision.overall_feedback:
-        console.print(f"[italic]{decision.overall_feedback}[/italic]")
+        parts.append(Text.from_markup(f"[italic]{decision.overall_feedback}[/italic]"))
 
-    _display_individual_scores(
-        console,
-        decision.criterion_scores,
-        get_display_name_func,
-        f"Judge {judge_number} Detailed Scoring",
+    parts.extend(
+        _render_individual_scores(
+            decision.criterion_scores,
+            get_display_name_func,
+            f"Judge {judge_number} Detailed Scoring",
+        )
     )
     reasoning = decision.reasoning
     if reasoning and not _is_structured_data(reasoning):
-        console.print(
-            "[dim]Reasoning:"
-            f" {reasoning[:MAX_REASONING_PREVIEW_LENGTH]}{'...' if len(reasoning) > MAX_REASONING_PREVIEW_LENGTH else ''}[/dim]"
+        parts.append(
+            Text.from_markup(
+                "[dim]Reasoning:"
+                f" {reasoning[:MAX_REASONING_PREVIEW_LENGTH]}{'...' if len(reasoning) > MAX_REASONING_PREVIEW_LENGTH else ''}[/dim]"
+            )
         )
+    return parts
 
 
 def _format_participants(config: AppConfig) -> str:
-    participants: list[str] = []
-    for model_id, model_config in config.models.items():
-        participants.append(
-            f"- {model_id}: {model_config.name} ({model_config.personality})"
-        )
-    return "\n".join(participants)
+    return "\n".join(
+        f"- {model_id}: {model_config.name} ({model_config.personality})"
+        for model_id, model_config in config.models.items()
+    )
 
 
 def _format_judge_info(config: AppConfig) -> str:
@@ -226,28 +290,29 @@ def _format_judge_info(config: AppConfig) -> str:
             f"Single judge: {config.judging.judge_models[0]} "
             f"({config.judging.judge_provider})"
         )
-        logger.info(
-            "Configured single judge: %s via %s",
-            config.judging.judge_models[0],
-            config.judging.judge_provider,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Configured single judge: %s via %s",
+                config.judging.judge_models[0],
+                config.judging.judge_provider,
+            )
         return judge_info
 
     judge_info = (
         f"Ensemble: {judge_count} judges ({', '.join(config.judging.judge_models)}) via"
         f" {config.judging.judge_provider}"
     )
-    logger.info(
-        "Configured ensemble judges: %s via %s",
-        config.judging.judge_models,
-        config.judging.judge_provider,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Configured ensemble judges: %s via %s",
+            config.judging.judge_models,
+            config.judging.judge_provider,
+        )
     return judge_info
 
 
-def _format_judge_decision_info(judge_decision: DisplayJudgeDecision) -> str:
-    """Format judge decision info string from Pydantic model."""
-    metadata = judge_decision.metadata
+def _format_judge_decision_info(metadata: DisplayEnsembleMetadata) -> str:
+    """Format judge decision info string from the decision's metadata."""
     ensemble_size = metadata.ensemble_size
 
     if ensemble_size and ensemble_size > 1:
@@ -260,15 +325,7 @@ def _format_judge_decision_info(judge_decision: DisplayJudgeDecision) -> str:
 
 
 def _get_victory_strength(margin: float) -> str:
-    if margin < 0.5:
-        return "Very Close"
-    if margin < 1.0:
-        return "Close Victory"
-    if margin < 2.0:
-        return "Clear Victory"
-    if margin < 3.0:
-        return "Strong Victory"
-    return "Decisive Victory"
+    return _VICTORY_STRENGTH_LABELS[bisect_right(_VICTORY_MARGIN_BOUNDS, margin)]
 
 
 def _check_incomplete_scoring(criterion_scores: list[CriterionScoreRow]) -> bool:
@@ -276,21 +333,21 @@ def _check_incomplete_scoring(criterion_scores: list[CriterionScoreRow]) -> bool
     if not criterion_scores:
         return True
 
-    participant_counts: dict[str, int] = {}
-    for score in criterion_scores:
-        participant_id = score.participant_id
-        participant_counts[participant_id] = (
-            participant_counts.get(participant_id, 0) + 1
-        )
+    participant_counts = Counter(score.participant_id for score in criterion_scores)
 
     expected_categories = 3
-    return any(count < expected_categories for count in participant_counts.values())
+    return min(participant_counts.values()) < expected_categories
 
 
 def _is_structured_data(text: str) -> bool:
     if not text:
         return False
 
+    # Every check below needs a "{" or "winner_id", so plain prose is
+    # rejected with two substring scans before any stripping or regex work
+    if "{" not in text and "winner_id" not in text:
+        return False
+
     stripped = text.strip()
     if stripped.startswith("{") and stripped.endswith("}"):
         try:
@@ -299,28 +356,40 @@ def _is_structured_data(text: str) -> bool:
         except json.JSONDecodeError:
             pass
 
-    dict_patterns = [
-        r"^\s*\{.*:\s*.*\}\s*$",
-        r"winner_id.*participant_id",
-    ]
+    return any(pattern.search(text) for pattern in _STRUCTURED_DATA_PATTERNS)
 
-    return any(re.search(pattern, text, re.DOTALL) for pattern in dict_patterns)
 
+@lru_cache(maxsize=128)
+def _format_score(score: float) -> str:
+    """Format a 0-10 score; scores repeat across criteria and judges."""
+    return f"{score:.1f}/10"
 
-def _display_detailed_scoring(
-    console: Console,
+
+def truncate_text(text: str, width: int) -> str:
+    """Fit text into width characters, ending with "…" when it was cut.
+
+    Shared by every table in the CLI so long values are cut the same way.
+    """
+    return text if len(text) <= width else f"{text[: width - 1]}…"
+
+
+def _render_detailed_scoring(
     criterion_scores: list[CriterionScoreRow],
     get_display_name: Callable[[str], str],
-) -> None:
-    """Display detailed scoring table using Pydantic models."""
+) -> list[RenderableType]:
+    """Build the detailed scoring table using Pydantic models."""
     if not criterion_scores:
-        return
+        return []
 
-    console.print("\n[bold blue]Detailed Scoring:[/bold blue]")
+    parts: list[RenderableType] = [
+        Text.from_markup("\n[bold blue]Detailed Scoring:[/bold blue]")
+    ]
 
     if _check_incomplete_scoring(criterion_scores):
-        console.print(
-            "[yellow]⚠️ Warning: Some scoring categories may be incomplete[/yellow]"
+        parts.append(
+            Text.from_markup(
+                "[yellow]⚠️ Warning: Some scoring categories may be incomplete[/yellow]"
+            )
         )
 
     scoring_table = Table(title="Judge Scoring Breakdown")
@@ -329,82 +398,69 @@ def _display_detailed_scoring(
     scoring_table.add_column("Score", justify="center", style="yellow", width=8)
     scoring_table.add_column("Feedback", style="dim", width=FEEDBACK_COLUMN_WIDTH)
 
+    # Cells are plain Text so Rich skips markup parsing, and brackets in
+    # model-written feedback are shown as written
     for score in criterion_scores:
         participant_id = score.participant_id
         participant_display_name = get_display_name(participant_id)
         criterion = score.criterion
-        score_value = score.score
         feedback = score.feedback or ""
 
         scoring_table.add_row(
-            participant_display_name,
-            criterion.title(),
-            f"{score_value:.1f}/10",
-            feedback[:FEEDBACK_TRUNCATE_LENGTH] + "..."
-            if len(feedback) > FEEDBACK_COLUMN_WIDTH
-            else feedback,
+            Text(participant_display_name),
+            Text(criterion.title()),
+            Text(_format_score(score.score)),
+            Text(truncate_text(feedback, FEEDBACK_COLUMN_WIDTH)),
         )
 
-    console.print(scoring_table)
+    parts.append(scoring_table)
+    return parts
 
 
-def _display_reasoning(console: Console, reasoning: str | None) -> None:
+def _render_reasoning(reasoning: str | None) -> list[RenderableType]:
     if not reasoning or _is_structured_data(reasoning):
-        return
+        return []
+
+    # Let Rich wrap the plain text in a single render instead of re-joining
+    # candidate lines word by word and printing each one separately. A single
+    # token longer than LINE_WRAP_LENGTH (e.g. a URL) is folded at that width.
+    return [
+        Text.from_markup("\n[bold blue]Judge's Reasoning:[/bold blue]"),
+        Constrain(Text(reasoning), width=LINE_WRAP_LENGTH),
+    ]
 
-    console.print("\n[bold blue]Judge's Reasoning:[/bold blue]")
-    reasoning_lines = reasoning.split("\n")
-    for line in reasoning_lines:
-        if len(line) > LINE_WRAP_LENGTH:
-            words = line.split()
-            current_line: list[str] = []
-            for word in words:
-                candidate = " ".join(current_line + [word])
-                if len(candidate) <= LINE_WRAP_LENGTH:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        console.print(" ".join(current_line))
-                        current_line = [word]
-                    else:
-                        console.print(word)
-            if current_line:
-                console.print(" ".join(current_line))
-        else:
-            console.print(line)
-
-
-def _display_individual_scores(
-    console: Console,
+
+def _render_individual_scores(
     criterion_scores: list[CriterionScoreRow],
     get_display_name_func: Callable[[str], str],
     title: str,
-) -> None:
-    """Display individual scores table using Pydantic models."""
+) -> list[RenderableType]:
+    """Build the individual scores table using Pydantic models."""
     if not criterion_scores:
-        return
+        return []
 
     individual_table = Table(title=title, width=80)
     individual_table.add_column("Participant", style="magenta", width=20)
     individual_table.add_column("Criterion", style="cyan", width=12)
     individual_table.add_column("Score", justify="center", style="yellow", width=6)
-    individual_table.add_column("Feedback", style="dim", width=35)
+    individual_table.add_column(
+        "Feedback", style="dim", width=INDIVIDUAL_FEEDBACK_COLUMN_WIDTH
+    )
 
     for score in criterion_scores:
         participant_id = score.participant_id
         participant_display_name = get_display_name_func(participant_id)
         criterion = score.criterion
-        score_value = score.score
         feedback = score.feedback or ""
 
         individual_table.add_row(
-            participant_display_name,
-            criterion.title(),
-            f"{score_value:.1f}/10",
-            feedback[:32] + "..." if len(feedback) > 35 else feedback,
+            Text(participant_display_name),
+            Text(criterion.title()),
+            Text(_format_score(score.score)),
+            Text(truncate_text(feedback, INDIVIDUAL_FEEDBACK_COLUMN_WIDTH)),
         )
 
-    console.print(individual_table)
+    return [individual_table]
 
 
 __all__ = [
@@ -412,6 +468,7 @@ __all__ = [
     "display_error",
     "display_individual_judge_decision",
     "display_judge_decision",
+    "truncate_text",
     "_format_participants",
     "_format_judge_info",
     "_get_victory_strength",
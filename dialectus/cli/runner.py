@@ -53,6 +53,10 @@ __all__ = [
 ]
 
 
+# Panel colour for each debate position
+_POSITION_STYLES = {"pro": "green", "con": "red", "neutral": "blue"}
+
+
 class _HasIsoformat(Protocol):
     """Protocol for objects with isoformat method (datetime, date, time)."""
 
@@ -83,17 +87,20 @@ class DebateRunner:
         self.console = console
 
         # Validate format exists (fail fast)
-        if self.config.debate.format not in format_registry.list_formats():
-            available = ", ".join(format_registry.list_formats())
+        available_formats = format_registry.list_formats()
+        if self.config.debate.format not in available_formats:
             raise ValueError(
                 f"Invalid debate format: {self.config.debate.format}. "
-                f"Available formats: {available}"
+                f"Available formats: {', '.join(available_formats)}"
             )
 
         self.model_manager = ModelManager(config.system)
         self.engine = DebateEngine(config, self.model_manager)
         self.db = DatabaseManager()
 
+        # (speaker_id, position) -> (panel title, border style)
+        self._speaker_headers: dict[tuple[str, str], tuple[str, str]] = {}
+
     async def run_debate(self) -> None:
         """Run a full debate with judging and save to database."""
         try:
@@ -181,7 +188,7 @@ class DebateRunner:
 
                 except (ProviderRateLimitError, ValueError, RuntimeError) as e:
                     judging_succeeded = False
-                    logger.error(f"Judge evaluation failed: {e}")
+                    logger.error("Judge evaluation failed: %s", e)
                     self.console.print(
                         f"\n[red]Judge evaluation failed: {e}[/red]", style="bold"
                     )
@@ -208,7 +215,7 @@ class DebateRunner:
                 )
 
             except (RuntimeError, ValueError, OSError) as e:
-                logger.error(f"Failed to save transcript: {e}")
+                logger.error("Failed to save transcript: %s", e)
                 self.console.print(
                     f"\n[red]Failed to save transcript: {e}[/red]", style="bold"
                 )
@@ -218,34 +225,40 @@ class DebateRunner:
             logger.error("Debate failed due to provider rate limit: %s", e)
             raise
         except (ValueError, RuntimeError, OSError) as e:
-            logger.error(f"Debate failed: {e}")
+            logger.error("Debate failed: %s", e)
             self.console.print(f"\n[red]Debate failed: {e}[/red]", style="bold")
             raise
 
     def display_message(self, message: MessageCompleteEventData) -> None:
         """Display a debate message with Rich formatting."""
-        style_map = {"pro": "green", "con": "red", "neutral": "blue"}
-
         position = message.position
-        speaker_style = style_map.get(position, "white")
-
-        # Get model name from config
         speaker_id = message.speaker_id
-        display_name = speaker_id
-        if speaker_id in self.config.models:
-            display_name = self.config.models[speaker_id].name
 
-        phase = message.phase
-        content = message.content
+        # Each speaker keeps one position for the whole debate, so the panel
+        # title and colour are built on their first message and then reused
+        key = (speaker_id, position)
+        header = self._speaker_headers.get(key)
+        if header is None:
+            speaker_style = _POSITION_STYLES.get(position, "white")
 
-        panel = Panel(
-            content,
-            title=(
+            # Get model name from config
+            display_name = speaker_id
+            if speaker_id in self.config.models:
+                display_name = self.config.models[speaker_id].name
+
+            title = (
                 f"[{speaker_style}]{display_name}[/{speaker_style}]"
                 f" ({position.upper()})"
-            ),
+            )
+            header = (title, speaker_style)
+            self._speaker_headers[key] = header
+
+        title, speaker_style = header
+        panel = Panel(
+            message.content,
+            title=title,
             border_style=speaker_style,
-            subtitle=f"{phase.title()}",
+            subtitle=message.phase.title(),
         )
 
         self.console.print(panel)
@@ -264,6 +277,9 @@ class DebateRunner:
                          or a dict from the engine (which we'll validate and convert)
         """
         total_debate_time_ms = context.metadata.get("total_debate_time_ms", 0)
+        # One timestamp per save, shared by saved_at and by any message that
+        # arrived without one of its own
+        now_iso = datetime.now().isoformat()
 
         # Build participant info
         participants: dict[str, ParticipantInfo] = {
@@ -274,6 +290,29 @@ class DebateRunner:
             for pid, p in context.participants.items()
         }
 
+        # Build messages and accumulate the debate word total in the same pass,
+        # so each message's content is only split once
+        messages: list[MessageData] = []
+        total_words = 0
+        for m in context.messages:
+            word_count = len(m.content.split())
+            total_words += word_count
+            messages.append(
+                MessageData(
+                    speaker_id=m.speaker_id,
+                    position=m.position.value,
+                    phase=m.phase.value,
+                    round_number=m.round_number,
+                    content=m.content,
+                    timestamp=_safe_isoformat(m.timestamp) or now_iso,
+                    word_count=word_count,
+                    metadata=m.metadata,
+                    cost=m.cost,
+                    generation_id=m.generation_id,
+                    cost_queried_at=_safe_isoformat(m.cost_queried_at),
+                )
+            )
+
         # Build metadata
         metadata = DebateMetadata(
             topic=context.topic,
@@ -281,53 +320,40 @@ class DebateRunner:
             participants=participants,
             final_phase=context.current_phase.value,
             total_rounds=context.current_round,
-            saved_at=datetime.now().isoformat(),
-            message_count=len(context.messages),
-            word_count=sum(len(m.content.split()) for m in context.messages),
+            saved_at=now_iso,
+            message_count=len(messages),
+            word_count=total_words,
             total_debate_time_ms=total_debate_time_ms,
         )
 
-        # Build messages
-        messages: list[MessageData] = [
-            MessageData(
-                speaker_id=m.speaker_id,
-                position=m.position.value,
-                phase=m.phase.value,
-                round_number=m.round_number,
-                content=m.content,
-                timestamp=_safe_isoformat(m.timestamp) or datetime.now().isoformat(),
-                word_count=len(m.content.split()),
-                metadata=m.metadata,
-                cost=m.cost,
-                generation_id=m.generation_id,
-                cost_queried_at=_safe_isoformat(m.cost_queried_at),
-            )
-            for m in context.messages
-        ]
-
         # Build complete transcript data
         transcript_data = DebateTranscriptData(
             metadata=metadata,
             messages=messages,
         )
 
-        db_id = self.db.save_debate(transcript_data)
-        logger.info(f"Saved transcript with database ID {db_id}")
-
-        # Save judge results if provided
-        if judge_result:
-            if isinstance(judge_result, EnsembleResultData):
-                # Already a Pydantic model
-                await self.save_ensemble_result(db_id, judge_result)
-            elif (
-                isinstance(judge_result, dict)
-                and judge_result.get("type") == "ensemble"
-            ):
-                # Convert dict from engine to Pydantic model for type safety
-                ensemble_data = EnsembleResultData.model_validate(judge_result)
-                await self.save_ensemble_result(db_id, ensemble_data)
-            elif isinstance(judge_result, JudgeDecision):
-                await self.save_individual_decision(db_id, judge_result)
+        # The transcript and its judge results commit together, so a failed
+        # judge save never leaves a debate behind without its decision. The
+        # block holds the write lock and an open transaction, so it must not
+        # await: only the synchronous _save_* helpers are called inside it.
+        with self.db.get_connection():
+            db_id = self.db.save_debate(transcript_data)
+            logger.info("Saved transcript with database ID %d", db_id)
+
+            # Save judge results if provided
+            if judge_result:
+                if isinstance(judge_result, EnsembleResultData):
+                    # Already a Pydantic model
+                    self._save_ensemble_result(db_id, judge_result)
+                elif (
+                    isinstance(judge_result, dict)
+                    and judge_result.get("type") == "ensemble"
+                ):
+                    # Convert dict from engine to Pydantic model for type safety
+                    ensemble_data = EnsembleResultData.model_validate(judge_result)
+                    self._save_ensemble_result(db_id, ensemble_data)
+                elif isinstance(judge_result, JudgeDecision):
+                    self._save_individual_decision(db_id, judge_result)
 
         return db_id
 
@@ -335,57 +361,72 @@ class DebateRunner:
         self, debate_id: int, judge_decision: JudgeDecision
     ) -> int:
         """Save a single judge decision to the database."""
-        logger.info(f"Saving individual judge decision for debate {debate_id}")
-
-        decision_id = self.db.save_judge_decision(
-            debate_id=debate_id,
-            winner_id=judge_decision.winner_id,
-            winner_margin=judge_decision.winner_margin,
-            overall_feedback=judge_decision.overall_feedback,
-            reasoning=judge_decision.reasoning,
-            judge_model=judge_decision.judge_model,
-            judge_provider=judge_decision.judge_provider,
-            generation_time_ms=judge_decision.generation_time_ms,
-            cost=judge_decision.cost,
-            generation_id=judge_decision.generation_id,
-            cost_queried_at=_safe_isoformat(judge_decision.cost_queried_at),
-        )
+        return self._save_individual_decision(debate_id, judge_decision)
 
-        # Save criterion scores
-        if judge_decision.criterion_scores:
-            criterion_data = [
-                {
-                    "criterion": score.criterion.value,
-                    "participant_id": score.participant_id,
-                    "score": score.score,
-                    "feedback": score.feedback,
-                }
-                for score in judge_decision.criterion_scores
-            ]
-            self.db.save_criterion_scores(decision_id, criterion_data)
-
-        logger.info(f"Saved judge decision {decision_id} for debate {debate_id}")
+    def _save_individual_decision(
+        self, debate_id: int, judge_decision: JudgeDecision
+    ) -> int:
+        """Save a single judge decision; safe to call inside a transaction."""
+        logger.info("Saving individual judge decision for debate %d", debate_id)
+
+        # The decision and its scores commit together as one transaction
+        with self.db.get_connection():
+            decision_id = self.db.save_judge_decision(
+                debate_id=debate_id,
+                winner_id=judge_decision.winner_id,
+                winner_margin=judge_decision.winner_margin,
+                overall_feedback=judge_decision.overall_feedback,
+                reasoning=judge_decision.reasoning,
+                judge_model=judge_decision.judge_model,
+                judge_provider=judge_decision.judge_provider,
+                generation_time_ms=judge_decision.generation_time_ms,
+                cost=judge_decision.cost,
+                generation_id=judge_decision.generation_id,
+                cost_queried_at=_safe_isoformat(judge_decision.cost_queried_at),
+            )
+
+            # Save criterion scores
+            if judge_decision.criterion_scores:
+                criterion_data = [
+                    {
+                        "criterion": score.criterion.value,
+                        "participant_id": score.participant_id,
+                        "score": score.score,
+                        "feedback": score.feedback,
+                    }
+                    for score in judge_decision.criterion_scores
+                ]
+                self.db.save_criterion_scores(decision_id, criterion_data)
+
+        logger.info("Saved judge decision %d for debate %d", decision_id, debate_id)
         return decision_id
 
     async def save_ensemble_result(
         self, debate_id: int, ensemble_result: EnsembleResultData
     ) -> None:
         """Save ensemble result - individual decisions + ensemble summary."""
+        self._save_ensemble_result(debate_id, ensemble_result)
+
+    def _save_ensemble_result(
+        self, debate_id: int, ensemble_result: EnsembleResultData
+    ) -> None:
+        """Save an ensemble result; safe to call inside a transaction."""
         decisions: list[JudgeDecision] = ensemble_result.decisions  # type: ignore[assignment]
         ensemble_summary: EnsembleResult = ensemble_result.ensemble_summary  # type: ignore[assignment]
 
         logger.info(
-            f"Saving ensemble result with {len(decisions)} decisions for debate"
-            f" {debate_id}"
+            "Saving ensemble result with %d decisions for debate %d",
+            len(decisions),
+            debate_id,
         )
 
         # Save each individual decision
         decision_ids: list[int] = []
         for i, decision in enumerate(decisions):
-            decision_id = await self.save_individual_decision(debate_id, decision)
+            decision_id = self._save_individual_decision(debate_id, decision)
             decision_ids.append(decision_id)
             logger.info(
-                f"Saved decision {i + 1}/{len(decisions)} with ID {decision_id}"
+                "Saved decision %d/%d with ID %d", i + 1, len(decisions), decision_id
             )
 
         # Save ensemble summary
@@ -401,7 +442,7 @@ class DebateRunner:
         )
 
         ensemble_id = self.db.save_ensemble_summary(debate_id, ensemble_data)
-        logger.info(f"Saved ensemble summary {ensemble_id} for debate {debate_id}")
+        logger.info("Saved ensemble summary %d for debate %d", ensemble_id, debate_id)
 
     def display_judge_results(
         self, db_id: int, judge_result: JudgeDecision | EnsembleResultData | None
@@ -472,5 +513,5 @@ class DebateRunner:
             KeyError,
             OSError,
         ) as e:
-            logger.error(f"Failed to display judge results: {e}")
+            logger.error("Failed to display judge results: %s", e)
             self.console.print(f"\n[red]Failed to display judge results: {e}[/red]")
@@ -20,7 +20,9 @@ def temp_db() -> Generator[str, None, None]:
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         db_path = f.name
     yield db_path
-    Path(db_path).unlink(missing_ok=True)
+    # WAL mode keeps -wal/-shm sidecar files next to the database
+    for suffix in ("", "-wal", "-shm"):
+        Path(db_path + suffix).unlink(missing_ok=True)
 
 
 @pytest.fixture
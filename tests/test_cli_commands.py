@@ -1,12 +1,20 @@
 """Tests for CLI commands using Click's test runner."""
 
+import asyncio
+import logging
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from dialectus.cli.main import cli
+from dialectus.cli.main import (
+    ColoredFormatter,
+    cli,
+    setup_logging,
+)
 from dialectus.cli.config import AppConfig
 from dialectus.cli.db_types import TranscriptListRow
 
@@ -27,6 +35,16 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert "Dialectus" in result.output
 
+    def test_cli_import_does_not_load_engine(self):
+        code = (
+            "import sys, dialectus.cli.main; "
+            "print(any(m.startswith('dialectus.engine') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
     def test_debate_help(self, cli_runner: CliRunner, temp_config_file: Path):
         result = cli_runner.invoke(
             cli, ["--config", str(temp_config_file), "debate", "--help"]
@@ -67,7 +85,7 @@ class TestCLICommands:
         )
         assert result.exit_code == 0
 
-    @patch("dialectus.cli.main.DebateRunner")
+    @patch("dialectus.cli.runner.DebateRunner")
     @patch("dialectus.cli.main.get_default_config")
     def test_debate_command(
         self,
@@ -94,7 +112,7 @@ class TestCLICommands:
     ):
         mock_get_config.return_value = mock_app_config
 
-        with patch("dialectus.cli.main.DebateRunner") as mock_runner_class:
+        with patch("dialectus.cli.runner.DebateRunner") as mock_runner_class:
             mock_runner = Mock()
             mock_runner.run_debate = AsyncMock()
             mock_runner_class.return_value = mock_runner
@@ -116,7 +134,7 @@ class TestCLICommands:
     ):
         mock_get_config.return_value = mock_app_config
 
-        with patch("dialectus.cli.main.DebateRunner") as mock_runner_class:
+        with patch("dialectus.cli.runner.DebateRunner") as mock_runner_class:
             mock_runner = Mock()
             mock_runner.run_debate = AsyncMock()
             mock_runner_class.return_value = mock_runner
@@ -253,6 +271,23 @@ class TestCLICommands:
         assert "AI Regulation" in result.output
         assert "Climate Change" in result.output
 
+    @patch("dialectus.cli.main.DatabaseManager")
+    @patch("dialectus.cli.main.get_default_config")
+    def test_transcripts_does_not_load_config(
+        self,
+        mock_get_config: Mock,
+        mock_db_manager: Mock,
+        cli_runner: CliRunner,
+    ):
+        mock_db_instance = Mock()
+        mock_db_instance.list_transcripts.return_value = []
+        mock_db_manager.return_value = mock_db_instance
+
+        result = cli_runner.invoke(cli, ["transcripts"])
+
+        assert result.exit_code == 0
+        mock_get_config.assert_not_called()
+
     @patch("dialectus.cli.main.DatabaseManager")
     @patch("dialectus.cli.main.get_default_config")
     def test_transcripts_with_limit(
@@ -282,7 +317,7 @@ class TestCLICommands:
     ):
         mock_get_config.return_value = mock_app_config
 
-        with patch("dialectus.cli.main.DebateRunner") as mock_runner_class:
+        with patch("dialectus.cli.runner.DebateRunner") as mock_runner_class:
             mock_runner = Mock()
             mock_runner.run_debate = AsyncMock(side_effect=Exception("Test error"))
             mock_runner_class.return_value = mock_runner
@@ -326,3 +361,70 @@ class TestCLICommands:
             # The command succeeds (exit 0) but prints SKIP messages for failed providers
             assert result.exit_code == 0
             assert "SKIP" in result.output or "Could not fetch" in result.output
+
+    @patch("dialectus.cli.main.get_default_config")
+    def test_list_models_queries_providers_concurrently(
+        self,
+        mock_get_config: Mock,
+        cli_runner: CliRunner,
+        mock_app_config: AppConfig,
+    ):
+        config = mock_app_config.model_copy(deep=True)
+        config.models["model_b"].provider = "openrouter"
+        config.system.openrouter.api_key = "test-key"
+        mock_get_config.return_value = config
+
+        # Each provider waits for the other to start; a serial loop would time out
+        started: dict[str, asyncio.Event] = {}
+
+        def make_fetch(name: str, other: str, model_id: str):
+            async def fetch():
+                started.setdefault(name, asyncio.Event()).set()
+                await asyncio.wait_for(
+                    started.setdefault(other, asyncio.Event()).wait(), timeout=1
+                )
+                return [Mock(id=model_id, provider=name, description="")]
+
+            return fetch
+
+        with (
+            patch(
+                "dialectus.engine.models.providers.ollama_provider.OllamaProvider"
+            ) as mock_ollama,
+            patch(
+                "dialectus.engine.models.providers.open_router_provider.OpenRouterProvider"
+            ) as mock_openrouter,
+        ):
+            mock_ollama.return_value.get_enhanced_models = make_fetch(
+                "ollama", "openrouter", "local-model"
+            )
+            mock_openrouter.return_value.get_enhanced_models = make_fetch(
+                "openrouter", "ollama", "remote-model"
+            )
+
+            result = cli_runner.invoke(cli, ["list-models"])
+
+        assert result.exit_code == 0
+        assert "SKIP" not in result.output
+        assert "local-model" in result.output
+        assert "remote-model" in result.output
+
+
+class TestLogging:
+    def test_colored_formatter_wraps_level_name(self):
+        formatter = ColoredFormatter(fmt="%(levelname)s %(message)s")
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "boom", None, None
+        )
+
+        assert formatter.format(record) == "\033[31mERROR\033[0m boom"
+
+    def test_setup_logging_can_change_level(self):
+        root = logging.getLogger()
+        original_level = root.level
+        try:
+            setup_logging("ERROR")
+            setup_logging("DEBUG")
+            assert root.level == logging.DEBUG
+        finally:
+            root.setLevel(original_level)
@@ -186,3 +186,25 @@ class TestConfigLoading:
 
                 assert config.system.ollama_base_url == "http://localhost:11434"
                 assert config.system.log_level == "INFO"
+
+
+class TestConfigReExports:
+    def test_engine_models_resolve_lazily(self):
+        from dialectus.engine.config import settings
+
+        from dialectus.cli import config as cli_config
+
+        assert cli_config.SystemConfig is settings.SystemConfig
+        assert cli_config.AppConfig is AppConfig
+
+    def test_unknown_attribute_raises(self):
+        from dialectus.cli import config as cli_config
+
+        with pytest.raises(AttributeError):
+            _ = cli_config.NotAConfigModel
+
+    def test_every_exported_name_resolves(self):
+        from dialectus.cli import config as cli_config
+
+        for name in cli_config.__all__:
+            assert getattr(cli_config, name) is not None
@@ -1,11 +1,13 @@
 """Tests for database layer (SQLite operations and data persistence)."""
 
+import json
 import sqlite3
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from dialectus.cli.database import DatabaseManager
+from dialectus.cli.database import DatabaseManager, get_database_path
 from dialectus.cli.db_types import DebateTranscriptData, EnsembleSummaryData
 
 
@@ -30,6 +32,54 @@ class TestDatabaseManager:
             assert "criterion_scores" in tables
             assert "ensemble_summary" in tables
 
+    def test_messages_have_single_debate_index(self, temp_db: str):
+        db = DatabaseManager(db_path=temp_db)
+        with db.get_connection() as conn:
+            # An index left by an older schema is dropped on the next startup
+            conn.execute("CREATE INDEX idx_messages_debate_id ON messages (debate_id)")
+        db.close()
+
+        with DatabaseManager(db_path=temp_db).get_connection(read_only=True) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master"
+                    " WHERE type='index' AND tbl_name='messages' AND sql IS NOT NULL"
+                )
+            }
+
+        assert indexes == {"idx_messages_debate_round"}
+
+    def test_schema_enables_wal(self, temp_db: str):
+        db = DatabaseManager(db_path=temp_db)
+
+        with db.get_connection(read_only=True) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_list_transcripts_uses_created_at_index(self, temp_db: str):
+        db = DatabaseManager(db_path=temp_db)
+
+        with db.get_connection(read_only=True) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM debates "
+                "ORDER BY created_at DESC LIMIT 20"
+            ).fetchall()
+        assert any("idx_debates_created_at" in row[3] for row in plan)
+
+    def test_load_transcript_messages_need_no_sort(self, temp_db: str):
+        db = DatabaseManager(db_path=temp_db)
+
+        with db.get_connection(read_only=True) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM messages "
+                "WHERE debate_id = ? ORDER BY round_number, id",
+                (1,),
+            ).fetchall()
+        details = [row[3] for row in plan]
+        assert any("idx_messages_debate_round" in detail for detail in details)
+        assert not any("TEMP B-TREE" in detail for detail in details)
+
     def test_save_and_load_debate(
         self, temp_db: str, sample_debate_data: DebateTranscriptData
     ):
@@ -202,6 +252,76 @@ class TestDatabaseManager:
             with pytest.raises(sqlite3.OperationalError):
                 conn.execute("DELETE FROM debates")
 
+    def test_read_only_connection_follows_db_path(
+        self,
+        temp_db: str,
+        tmp_path: Path,
+        sample_debate_data: DebateTranscriptData,
+    ):
+        db = DatabaseManager(db_path=temp_db)
+        other_path = str(tmp_path / "other.db")
+        DatabaseManager(db_path=other_path)
+
+        db.db_path = other_path
+        debate_id = db.save_debate(sample_debate_data)
+
+        with db.get_connection(read_only=True) as conn:
+            row = conn.execute(
+                "SELECT id FROM debates WHERE id = ?", (debate_id,)
+            ).fetchone()
+        assert row is not None
+
+    def test_write_connection_is_reused(
+        self, temp_db: str, sample_debate_data: DebateTranscriptData
+    ):
+        db = DatabaseManager(db_path=temp_db)
+
+        with db.get_connection() as first:
+            pass
+        db.save_debate(sample_debate_data)
+        with db.get_connection() as second:
+            pass
+        assert first is second
+
+        db.close()
+        with db.get_connection() as reopened:
+            assert reopened is not first
+
+    def test_nested_writes_share_one_transaction(
+        self, temp_db: str, sample_debate_data: DebateTranscriptData
+    ):
+        db = DatabaseManager(db_path=temp_db)
+
+        def save_then_fail() -> None:
+            with db.get_connection():
+                db.save_debate(sample_debate_data)
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            save_then_fail()
+
+        assert db.list_transcripts() == []
+
+    def test_interrupted_write_is_rolled_back(
+        self, temp_db: str, sample_debate_data: DebateTranscriptData
+    ):
+        db = DatabaseManager(db_path=temp_db)
+
+        def save_then_interrupt() -> None:
+            with db.get_connection():
+                db.save_debate(sample_debate_data)
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            save_then_interrupt()
+
+        debate_id = db.save_debate(sample_debate_data)
+
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT 1").fetchone() is not None
+        assert not conn.in_transaction
+        assert [t.id for t in db.list_transcripts()] == [debate_id]
+
     def test_message_storage_preserves_metadata(
         self, temp_db: str, sample_debate_data: DebateTranscriptData
     ):
@@ -213,6 +333,33 @@ class TestDatabaseManager:
         loaded = db.load_transcript(debate_id)
         assert loaded is not None
         assert loaded.messages[0].speaker_id == "model_a"
+        assert loaded.messages[0].metadata is not None
+        assert json.loads(loaded.messages[0].metadata) == {"custom_field": "test_value"}
+
+    def test_empty_message_metadata_stored_as_null(
+        self, temp_db: str, sample_debate_data: DebateTranscriptData
+    ):
+        db = DatabaseManager(db_path=temp_db)
+
+        sample_debate_data.messages[0].metadata = {}
+        sample_debate_data.messages[1].metadata = None
+        debate_id = db.save_debate(sample_debate_data)
+
+        loaded = db.load_transcript(debate_id)
+        assert [m.metadata for m in loaded.messages] == [None, None]
+
+    def test_debate_json_columns_round_trip(
+        self, temp_db: str, sample_debate_data: DebateTranscriptData
+    ):
+        db = DatabaseManager(db_path=temp_db)
+        debate_id = db.save_debate(sample_debate_data)
+
+        loaded = db.load_transcript(debate_id)
+        participants = json.loads(loaded.metadata.participants)
+        assert participants["model_a"]["name"] == "qwen2.5:7b"
+        assert loaded.metadata.context_metadata is not None
+        context = json.loads(loaded.metadata.context_metadata)
+        assert context["topic"] == sample_debate_data.metadata.topic
 
     def test_empty_database_list_transcripts(self, temp_db: str):
         db = DatabaseManager(db_path=temp_db)
@@ -232,3 +379,21 @@ class TestDatabaseManager:
         db = DatabaseManager(db_path=temp_db)
         with pytest.raises(EnsembleSummaryNotFoundError):
             db.load_ensemble_summary(99999)
+
+
+class TestGetDatabasePath:
+    def test_directory_created_once_and_path_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        get_database_path.cache_clear()
+        try:
+            first = get_database_path()
+            assert first == tmp_path / ".dialectus" / "debates.db"
+            assert first.parent.is_dir()
+
+            first.parent.rmdir()
+            assert get_database_path() is first
+            assert not first.parent.exists()
+        finally:
+            get_database_path.cache_clear()
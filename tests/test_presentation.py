@@ -1,5 +1,6 @@
 """Tests for presentation and display formatting functions."""
 
+import io
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -7,9 +8,11 @@ import pytest
 from rich.console import Console
 
 from dialectus.cli.presentation import (
+    LINE_WRAP_LENGTH,
     display_debate_info,
     display_judge_decision,
     display_error,
+    truncate_text,
     _format_participants,  # pyright: ignore[reportPrivateUsage]
     _format_judge_info,  # pyright: ignore[reportPrivateUsage]
     _get_victory_strength,  # pyright: ignore[reportPrivateUsage]
@@ -42,6 +45,14 @@ class TestDisplayFunctions:
         display_debate_info(mock_console, sample_config)
         mock_console.print.assert_called_once()
 
+    def test_display_debate_info_lines_are_not_indented(self, sample_config: AppConfig):
+        output = io.StringIO()
+        display_debate_info(Console(file=output, width=200), sample_config)
+
+        rendered = output.getvalue()
+        assert "│ Format: Oxford" in rendered
+        assert "│ Participants:" in rendered
+
     def test_format_participants(self, sample_config: AppConfig):
         result = _format_participants(sample_config)
 
@@ -76,6 +87,13 @@ class TestDisplayFunctions:
         assert _get_victory_strength(2.5) == "Strong Victory"
         assert _get_victory_strength(3.5) == "Decisive Victory"
 
+    def test_get_victory_strength_boundaries(self):
+        assert _get_victory_strength(0.0) == "Very Close"
+        assert _get_victory_strength(0.5) == "Close Victory"
+        assert _get_victory_strength(1.0) == "Clear Victory"
+        assert _get_victory_strength(2.0) == "Strong Victory"
+        assert _get_victory_strength(3.0) == "Decisive Victory"
+
     def test_is_structured_data_with_json(self):
         assert _is_structured_data('{"key": "value"}')
         assert _is_structured_data('  {"winner": "model_a"}  ')
@@ -87,6 +105,12 @@ class TestDisplayFunctions:
         assert not _is_structured_data("This is plain text reasoning.")
         assert not _is_structured_data("")
 
+    def test_truncate_text(self):
+        assert truncate_text("short", 10) == "short"
+        assert truncate_text("x" * 10, 10) == "x" * 10
+        assert truncate_text("x" * 11, 10) == "x" * 9 + "…"
+        assert len(truncate_text("x" * 200, 50)) == 50
+
     def test_check_incomplete_scoring_empty(self):
         assert _check_incomplete_scoring([])
 
@@ -301,3 +325,91 @@ class TestDisplayFunctions:
         display_judge_decision(mock_console, sample_config, decision)
 
         assert mock_console.print.call_count > 0
+
+    def test_display_judge_decision_wraps_long_reasoning(
+        self, sample_config: AppConfig
+    ):
+        output = io.StringIO()
+        console = Console(file=output, width=200)
+        decision = DisplayJudgeDecision(
+            winner_id="model_a",
+            winner_margin=1.0,
+            overall_feedback=None,
+            reasoning="evidence " * 40 + "\n[bold]literal[/bold] brackets",
+            criterion_scores=[],
+            metadata=DisplayEnsembleMetadata(
+                ensemble_size=1,
+                consensus_level=None,
+                ensemble_method="single",
+                individual_decisions=[],
+            ),
+        )
+
+        display_judge_decision(console, sample_config, decision)
+
+        lines = output.getvalue().splitlines()
+        assert all(len(line) <= LINE_WRAP_LENGTH for line in lines)
+        assert "[bold]literal[/bold] brackets" in lines
+
+    def test_display_judge_decision_prints_once(
+        self, mock_console: Mock, sample_config: AppConfig
+    ):
+        decision = DisplayJudgeDecision(
+            winner_id="model_a",
+            winner_margin=2.0,
+            overall_feedback="Good performance",
+            reasoning="Clear arguments",
+            criterion_scores=[
+                CriterionScoreRow(
+                    id=1,
+                    judge_decision_id=1,
+                    participant_id="model_a",
+                    criterion="logic",
+                    score=8.5,
+                    feedback="Strong",
+                )
+            ],
+            metadata=DisplayEnsembleMetadata(
+                ensemble_size=1,
+                consensus_level=None,
+                ensemble_method="single",
+                judge_model="judge1",
+                individual_decisions=[],
+            ),
+        )
+
+        display_judge_decision(mock_console, sample_config, decision)
+
+        mock_console.print.assert_called_once()
+
+    def test_scoring_table_shows_feedback_brackets_literally(
+        self, sample_config: AppConfig
+    ):
+        output = io.StringIO()
+        console = Console(file=output, width=200)
+        decision = DisplayJudgeDecision(
+            winner_id="model_a",
+            winner_margin=1.0,
+            overall_feedback=None,
+            reasoning=None,
+            criterion_scores=[
+                CriterionScoreRow(
+                    id=1,
+                    judge_decision_id=1,
+                    participant_id="model_a",
+                    criterion="logic",
+                    score=8.0,
+                    feedback="[bold]cited[/bold]",
+                )
+            ],
+            metadata=DisplayEnsembleMetadata(
+                ensemble_size=1,
+                consensus_level=None,
+                ensemble_method="single",
+                individual_decisions=[],
+            ),
+        )
+
+        display_judge_decision(console, sample_config, decision)
+
+        assert "[bold]cited[/bold]" in output.getvalue()
@@ -1,9 +1,10 @@
 """Tests for debate runner orchestration with async patterns and mocking."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from rich.panel import Panel
 
 from dialectus.cli.runner import (
     DebateRunner,
@@ -124,7 +125,7 @@ class TestDebateRunner:
         temp_db: str,
     ):
         with patch("dialectus.cli.runner.DatabaseManager") as mock_db_class:
-            mock_db = Mock()
+            mock_db = MagicMock()
             mock_db.save_debate.return_value = 1
             mock_db.save_judge_decision.return_value = 1
             mock_db.save_criterion_scores.return_value = None
@@ -212,7 +213,7 @@ class TestDebateRunner:
         mock_config.judging.judge_models = []
 
         with patch("dialectus.cli.runner.DatabaseManager") as mock_db_class:
-            mock_db = Mock()
+            mock_db = MagicMock()
             mock_db.save_debate.return_value = 1
             mock_db_class.return_value = mock_db
 
@@ -259,7 +260,7 @@ class TestDebateRunner:
         temp_db: str,
     ):
         with patch("dialectus.cli.runner.DatabaseManager") as mock_db_class:
-            mock_db = Mock()
+            mock_db = MagicMock()
             mock_db.save_debate.return_value = 42
             mock_db.save_judge_decision.return_value = 1
             mock_db.save_criterion_scores.return_value = None
@@ -278,6 +279,76 @@ class TestDebateRunner:
             transcript_payload = args[0]
             # transcript_payload is now a Pydantic model, not a dict
             assert transcript_payload.messages[0].timestamp is not None
+            # Messages without a timestamp fall back to the save time
+            assert (
+                transcript_payload.messages[0].timestamp
+                == transcript_payload.metadata.saved_at
+            )
+            assert transcript_payload.messages[0].word_count == 4
+            assert transcript_payload.metadata.word_count == 4
+
+    @pytest.mark.asyncio
+    async def test_save_transcript_rolls_back_when_judge_save_fails(
+        self,
+        mock_config: AppConfig,
+        mock_console: Mock,
+        mock_debate_context: Mock,
+        mock_judge_decision: JudgeDecision,
+        temp_db: str,
+    ):
+        from dialectus.cli.database import DatabaseManager
+
+        real_db = DatabaseManager(temp_db)
+        with (
+            patch("dialectus.cli.runner.DatabaseManager", return_value=real_db),
+            patch.object(
+                real_db, "save_judge_decision", side_effect=RuntimeError("boom")
+            ),
+        ):
+            runner = DebateRunner(mock_config, mock_console)
+
+            with pytest.raises(RuntimeError):
+                await runner.save_transcript(mock_debate_context, mock_judge_decision)
+
+        assert real_db.list_transcripts() == []
+
+    def test_save_transcript_never_suspends_inside_transaction(
+        self,
+        mock_config: AppConfig,
+        mock_console: Mock,
+        mock_debate_context: Mock,
+        mock_judge_decision: JudgeDecision,
+        temp_db: str,
+    ):
+        from dialectus.cli.database import DatabaseManager
+
+        real_db = DatabaseManager(temp_db)
+        with patch("dialectus.cli.runner.DatabaseManager", return_value=real_db):
+            runner = DebateRunner(mock_config, mock_console)
+
+        ensemble_result = EnsembleResultData(
+            type="ensemble",
+            decisions=[mock_judge_decision, mock_judge_decision],
+            ensemble_summary=EnsembleResult(
+                final_winner_id="model_a",
+                final_margin=2.8,
+                ensemble_method="majority_vote_with_tiebreaker",
+                num_judges=2,
+                consensus_level=0.95,
+                summary_reasoning="Unanimous",
+                summary_feedback="Strong",
+            ),
+        )
+
+        # A coroutine that never awaits finishes on its first step, so no
+        # other task can run while the write transaction is open
+        coro = runner.save_transcript(mock_debate_context, ensemble_result)
+        with pytest.raises(StopIteration) as finished:
+            coro.send(None)
+
+        debate_id = finished.value.value
+        assert real_db.load_ensemble_summary(debate_id).num_judges == 2
+        assert len(real_db.load_judge_decisions(debate_id)) == 2
 
     @pytest.mark.asyncio
     async def test_save_individual_decision(
@@ -289,7 +360,7 @@ class TestDebateRunner:
         sample_debate_data: DebateTranscriptData,
     ):
         with patch("dialectus.cli.runner.DatabaseManager") as mock_db_class:
-            mock_db = Mock()
+            mock_db = MagicMock()
             mock_db.db_path = temp_db
             mock_db_class.return_value = mock_db
 
@@ -300,6 +371,7 @@ class TestDebateRunner:
             mock_db.load_judge_decision = real_db.load_judge_decision
             mock_db.save_judge_decision = real_db.save_judge_decision
             mock_db.save_criterion_scores = real_db.save_criterion_scores
+            mock_db.get_connection = real_db.get_connection
 
             runner = DebateRunner(mock_config, mock_console)
 
@@ -313,6 +385,9 @@ class TestDebateRunner:
             loaded = real_db.load_judge_decision(debate_id)
             assert loaded is not None
             assert loaded.winner_id == "model_a"
+            assert len(loaded.criterion_scores) == len(
+                mock_judge_decision.criterion_scores
+            )
 
     @pytest.mark.asyncio
     async def test_save_ensemble_result(
@@ -380,6 +455,36 @@ class TestDebateRunner:
 
             mock_console.print.assert_called()
 
+    def test_display_message_reuses_speaker_header(
+        self, mock_config: AppConfig, mock_console: Mock, temp_db: str
+    ):
+        with patch("dialectus.cli.runner.DatabaseManager"):
+            runner = DebateRunner(mock_config, mock_console)
+
+        for phase in ("opening", "rebuttal"):
+            runner.display_message(
+                MessageCompleteEventData(
+                    message_id=f"msg_{phase}",
+                    speaker_id="model_a",
+                    position="pro",
+                    phase=phase,
+                    content="Test message",
+                    round_number=1,
+                    timestamp="2025-01-01T00:00:00",
+                    word_count=2,
+                    metadata={},
+                )
+            )
+
+        panels = [
+            call.args[0]
+            for call in mock_console.print.call_args_list
+            if call.args and isinstance(call.args[0], Panel)
+        ]
+        assert [panel.subtitle for panel in panels] == ["Opening", "Rebuttal"]
+        assert panels[0].title is panels[1].title
+        assert panels[0].title == "[green]qwen2.5:7b[/green] (PRO)"
+
     def test_display_judge_results(
         self,
         mock_config: AppConfig,
@@ -387,7 +492,7 @@ class TestDebateRunner:
         mock_judge_decision: JudgeDecision,
     ):
         with patch("dialectus.cli.runner.DatabaseManager") as mock_db_class:
-            mock_db = Mock()
+            mock_db = MagicMock()
             # Return proper Pydantic model, not dict
             mock_db.load_judge_decision.return_value = JudgeDecisionWithScores(
                 id=1,